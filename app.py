@@ -1,18 +1,76 @@
 from fastapi import FastAPI, HTTPException, Request
-from fastapi.responses import HTMLResponse
+from fastapi.responses import HTMLResponse, JSONResponse, Response
 from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
-from pydantic import BaseModel, Field
-import pandas as pd
+from fastapi.concurrency import run_in_threadpool
+from jinja2 import Environment, FileSystemLoader, select_autoescape
+from pydantic import BaseModel, ConfigDict, Field
+import numpy as np
 import joblib
+from joblib import parallel_config
+import orjson
+import msgspec
+from sklearn import config_context
+from sklearn.ensemble import ExtraTreesClassifier, RandomForestClassifier
+from sklearn.tree import DecisionTreeClassifier
 import os
-from typing import List, Dict, Any
+import re
+import hashlib
+from typing import Annotated, List, Dict, Any, Optional, Tuple
 import logging
-from datetime import datetime
+import logging.handlers
+import queue
+import warnings
+import asyncio
+import threading
+from contextlib import asynccontextmanager, nullcontext
+from datetime import datetime, timezone
 
-# Configure logging
-logging.basicConfig(level=logging.INFO)
+# Configure logging. During import (model loading) records go straight to
+# stderr so load failures are always written. Once a worker is serving,
+# lifespan switches the logger to a queue drained by a listener thread so
+# request handlers never block on log I/O.
+log_handler = logging.StreamHandler()
+log_handler.setFormatter(logging.Formatter(logging.BASIC_FORMAT))
+log_queue = queue.SimpleQueue()
+log_queue_handler = logging.handlers.QueueHandler(log_queue)
+log_listener = logging.handlers.QueueListener(log_queue, log_handler)
 logger = logging.getLogger(__name__)
+logger.addHandler(log_handler)
+logger.setLevel(os.getenv("LOG_LEVEL", "WARNING").upper())
+logger.propagate = False
+
+class ORJSONResponse(JSONResponse):
+    """JSON response rendered with orjson"""
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, option=orjson.OPT_SERIALIZE_NUMPY)
+
+def utc_timestamp() -> str:
+    """Current UTC time as an ISO 8601 string with second precision"""
+    return datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+# Response timestamp, refreshed once per second instead of formatted per request
+_now_iso = [utc_timestamp()]
+
+async def refresh_timestamp():
+    """Keep _now_iso current while the app is running"""
+    while True:
+        _now_iso[0] = utc_timestamp()
+        await asyncio.sleep(1.0)
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Run background tasks for the lifetime of the app"""
+    log_listener.start()
+    logger.addHandler(log_queue_handler)
+    logger.removeHandler(log_handler)
+    timestamp_task = asyncio.create_task(refresh_timestamp())
+    yield
+    timestamp_task.cancel()
+    logger.addHandler(log_handler)
+    logger.removeHandler(log_queue_handler)
+    log_listener.stop()
 
 # Initialize FastAPI app
 app = FastAPI(
@@ -20,10 +78,13 @@ app = FastAPI(
     description="A machine learning API for predicting traffic congestion levels in Kigali, Rwanda",
     version="1.0.0",
     docs_url="/docs",
-    redoc_url="/redoc"
+    redoc_url="/redoc",
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan
 )
 
-# Load the model and encoders
+# Load the model and encoders; under gunicorn --preload this happens once in
+# the master process and workers share the loaded objects copy-on-write
 try:
     model = joblib.load('model/traffic_model.pkl')
     le_dict = joblib.load('model/label_encoders.pkl')
@@ -32,6 +93,194 @@ except Exception as e:
     logger.error(f"Error loading model: {e}")
     raise
 
+# Categorical features and their label-encoded lookups, built once at startup
+categorical_cols = ['Day_of_Week', 'Public_Holiday', 'Road_Name', 'Population_Density', 'Rainfall']
+class_to_int = {
+    col: {c: i for i, c in enumerate(le_dict[col].classes_)}
+    for col in categorical_cols
+}
+CATEGORY_ERRORS = {
+    col: f"Invalid value in {col}. Must be one of {list(le_dict[col].classes_)}"
+    for col in categorical_cols
+}
+# Column order the model was trained with; older models without recorded
+# feature names expect Hour first
+HAS_FEATURE_NAMES = hasattr(model, 'feature_names_in_')
+FEATURE_ORDER = list(model.feature_names_in_) if HAS_FEATURE_NAMES else ['Hour'] + categorical_cols
+CONGESTION_CLASSES = tuple(le_dict['Congestion_Level'].classes_.tolist())
+
+# Prefer ONNX Runtime for inference when a converted model is available
+# (see convert_model.py); otherwise fall back to the scikit-learn model
+def load_onnx_session():
+    """Open model/traffic_model.onnx if it matches the loaded model, else return None"""
+    if not os.path.exists('model/traffic_model.onnx'):
+        return None
+    try:
+        import onnxruntime as ort
+    except ImportError:
+        logger.warning("onnxruntime is not installed, using scikit-learn for inference")
+        return None
+
+    try:
+        sess_options = ort.SessionOptions()
+        sess_options.intra_op_num_threads = 1  # Parallelism comes from the server workers
+        session = ort.InferenceSession(
+            'model/traffic_model.onnx', sess_options, providers=['CPUExecutionProvider']
+        )
+    except Exception as e:
+        logger.warning(f"Could not load ONNX model ({e}), using scikit-learn for inference")
+        return None
+
+    # The ONNX file must have been converted from the pickle that is loaded now
+    with open('model/traffic_model.pkl', 'rb') as f:
+        model_hash = hashlib.sha256(f.read()).hexdigest()
+    outputs = {output.name: output for output in session.get_outputs()}
+    problem = None
+    if session.get_modelmeta().custom_metadata_map.get('source_model_sha256') != model_hash:
+        problem = "it was not converted from model/traffic_model.pkl"
+    elif session.get_inputs()[0].shape[1] != len(FEATURE_ORDER):
+        problem = f"it expects {session.get_inputs()[0].shape[1]} features, not {len(FEATURE_ORDER)}"
+    elif 'probabilities' in outputs and outputs['probabilities'].shape[1] != len(model.classes_):
+        problem = f"it predicts {outputs['probabilities'].shape[1]} classes, not {len(model.classes_)}"
+    if problem:
+        logger.warning(f"Ignoring model/traffic_model.onnx because {problem}; "
+                       "run convert_model.py to regenerate it. Using scikit-learn for inference")
+        return None
+
+    logger.info("ONNX model loaded, using ONNX Runtime for inference")
+    return session
+
+onnx_session = load_onnx_session()
+if onnx_session is not None:
+    ONNX_INPUT_NAME = onnx_session.get_inputs()[0].name
+    onnx_outputs = [output.name for output in onnx_session.get_outputs()]
+    ONNX_LABEL_OUTPUT = onnx_outputs[0]
+    ONNX_PROBA_OUTPUT = 'probabilities' if 'probabilities' in onnx_outputs else None
+
+# Model metadata never changes after load, so /model-info is serialized once
+MODEL_INFO = {
+    "model_type": type(model).__name__,
+    "available_categories": {
+        col: le.classes_.tolist() for col, le in le_dict.items() if hasattr(le, 'classes_')
+    },
+    "expected_features": FEATURE_ORDER if HAS_FEATURE_NAMES else None
+}
+MODEL_INFO_BYTES = orjson.dumps(MODEL_INFO)
+
+# Confidence reported when the model cannot produce class probabilities
+HAS_PROBA = hasattr(model, 'predict_proba')
+DEFAULT_CONFIDENCE = 0.8
+
+# Trees and forests predict the argmax of predict_proba(), so for them one
+# call gives both; other models (e.g. SVC) may disagree and call predict()
+LABEL_FROM_PROBA = HAS_PROBA and isinstance(
+    model, (RandomForestClassifier, ExtraTreesClassifier, DecisionTreeClassifier)
+)
+
+# With ONNX Runtime serving predictions the forest is only needed for the
+# metadata above, so its trees are not kept in memory
+if onnx_session is not None and hasattr(model, 'estimators_'):
+    del model.estimators_
+
+# Rows are fed to the model as plain arrays in FEATURE_ORDER
+warnings.filterwarnings("ignore", message="X does not have valid feature names")
+
+# Inputs are always encoded here as finite float32 rows of the right width,
+# so scikit-learn's per-call input and parameter validation can be skipped
+if hasattr(model, '_validate_X_predict'):
+    model._validate_X_predict = lambda X, *args, **kwargs: X
+
+def encode_batch(items: List["TrafficInputStruct"], X: np.ndarray) -> List[Optional[str]]:
+    """Encode inputs column by column into X, returning an error message (or None) per row"""
+    errors: List[Optional[str]] = [None] * len(items)
+    for i, col in enumerate(FEATURE_ORDER):
+        if col == 'Hour':
+            X[:, i] = [item.Hour for item in items]
+            continue
+        lookup = class_to_int[col]
+        codes = [lookup.get(getattr(item, col), -1) for item in items]
+        X[:, i] = codes
+        if -1 in codes:
+            for row, code in enumerate(codes):
+                if code == -1 and errors[row] is None:
+                    errors[row] = CATEGORY_ERRORS[col]
+    return errors
+
+# Large batches can spread tree ensembles (e.g. RandomForest) over threads;
+# tree traversal releases the GIL. The default server already runs one
+# worker per core, so this stays 1; single-worker setups can set -1.
+INFERENCE_N_JOBS = int(os.getenv("INFERENCE_N_JOBS", 1))
+PARALLEL_MIN_ROWS = 64
+
+def inference_context(n_rows: int):
+    """Parallel backend for a scikit-learn call over n_rows rows"""
+    if n_rows >= PARALLEL_MIN_ROWS:
+        return parallel_config(backend="threading", n_jobs=INFERENCE_N_JOBS)
+    return nullcontext()
+
+def run_model(X: np.ndarray):
+    """Return predicted class indices and confidence scores for the rows of X"""
+    if onnx_session is not None:
+        feed = {ONNX_INPUT_NAME: X.astype(np.float32, copy=False)}
+        if ONNX_PROBA_OUTPUT is None:
+            predictions, = onnx_session.run([ONNX_LABEL_OUTPUT], feed)
+            return predictions, np.full(len(X), DEFAULT_CONFIDENCE)
+        predictions, probabilities = onnx_session.run([ONNX_LABEL_OUTPUT, ONNX_PROBA_OUTPUT], feed)
+        return predictions, probabilities.max(axis=1)
+
+    # scikit-learn's config is thread-local, so apply it in the calling thread
+    with config_context(assume_finite=True, skip_parameter_validation=True), inference_context(len(X)):
+        if LABEL_FROM_PROBA:
+            probabilities = model.predict_proba(X)
+            return model.classes_.take(probabilities.argmax(axis=1)), probabilities.max(axis=1)
+        predictions = model.predict(X)
+        if HAS_PROBA:
+            return predictions, model.predict_proba(X).max(axis=1)
+        return predictions, np.full(len(X), DEFAULT_CONFIDENCE)
+
+# Reusable feature buffers per threadpool thread, keyed by row-count size class.
+# float32 matches both the ONNX input type and scikit-learn's tree dtype.
+BUFFER_SIZE_CLASSES = (1, 8, 64, 512)
+_buffers = threading.local()
+
+def get_feature_buffer(n_rows: int) -> np.ndarray:
+    """Return this thread's feature buffer with room for n_rows rows, sliced to n_rows"""
+    pool = getattr(_buffers, 'pool', None)
+    if pool is None:
+        pool = _buffers.pool = {}
+    size = next((size for size in BUFFER_SIZE_CLASSES if size >= n_rows), n_rows)
+    buffer = pool.get(size)
+    if buffer is None:
+        buffer = pool[size] = np.empty((size, len(FEATURE_ORDER)), dtype=np.float32)
+    return buffer[:n_rows]
+
+def encode_input(input_data) -> tuple:
+    """Encode one validated input into a feature tuple, raising ValueError on unknown categories"""
+    encoded_row = []
+    for col in FEATURE_ORDER:
+        if col == 'Hour':
+            encoded_row.append(input_data.Hour)
+            continue
+        encoded = class_to_int[col].get(getattr(input_data, col))
+        if encoded is None:
+            raise ValueError(CATEGORY_ERRORS[col])
+        encoded_row.append(encoded)
+    return tuple(encoded_row)
+
+def predict_one(key: tuple) -> Tuple[str, float]:
+    """Predict (congestion level, confidence score) for one encoded feature tuple"""
+    user_input = get_feature_buffer(1)
+    user_input[0] = key
+    prediction, confidence_scores = run_model(user_input)
+    return CONGESTION_CLASSES[int(prediction[0])], float(confidence_scores[0])
+
+# /predict results by encoded feature tuple. Every possible input (24 hours
+# times each category combination) fits, so entries are never evicted. The
+# cache and its counters are only touched from the event loop.
+CACHE_MAXSIZE = 24 * int(np.prod([len(class_to_int[col]) for col in categorical_cols]))
+prediction_cache: Dict[tuple, Tuple[str, float]] = {}
+cache_stats = {"hits": 0, "misses": 0}
+
 # Define input data model using Pydantic with validation
 class TrafficInput(BaseModel):
     Hour: int = Field(..., ge=0, le=23, description="Hour of the day (0-23)")
@@ -41,8 +290,8 @@ class TrafficInput(BaseModel):
     Population_Density: str = Field(..., description="Population density level")
     Rainfall: str = Field(..., description="Rainfall condition")
 
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "Hour": 8,
                 "Day_of_Week": "Monday",
@@ -52,109 +301,148 @@ class TrafficInput(BaseModel):
                 "Rainfall": "No"
             }
         }
+    )
+
+# Request bodies and batch items are validated into this struct with msgspec;
+# TrafficInput documents the same schema in /docs
+class TrafficInputStruct(msgspec.Struct):
+    Hour: Annotated[int, msgspec.Meta(ge=0, le=23)]
+    Day_of_Week: str
+    Public_Holiday: str
+    Road_Name: str
+    Population_Density: str
+    Rainfall: str
+
+# strict=False keeps Pydantic's lax coercion, e.g. "Hour": "8"
+predict_decoder = msgspec.json.Decoder(TrafficInputStruct, strict=False)
+
+def decode_error_detail(e: msgspec.DecodeError) -> List[Dict[str, Any]]:
+    """Convert a msgspec decode error into FastAPI's 422 detail shape"""
+    msg, _, path = str(e).partition(" - at `$")
+    loc: List[Any] = ["body"]
+    for key, index in re.findall(r"\.([^.\[`]+)|\[(\d+)\]", path):
+        loc.append(key or int(index))
+    missing = re.search(r"missing required field `([^`]+)`", msg)
+    if missing:
+        loc.append(missing.group(1))
+    if not isinstance(e, msgspec.ValidationError):
+        error_type = "json_invalid"
+    else:
+        error_type = "missing" if missing else "value_error"
+    return [{"type": error_type, "loc": loc, "msg": msg}]
 
 class PredictionResponse(BaseModel):
     Congestion_Level: str
     confidence_score: float
     timestamp: str
 
+class BatchInput(BaseModel):
+    # Items are validated one by one in the handler so a bad item fails only its own row
+    items: List[Any] = Field(
+        ...,
+        min_length=1,
+        max_length=512,
+        description="Inputs to predict (up to 512)",
+        json_schema_extra={"items": TrafficInput.model_json_schema()}
+    )
+
+class BatchPredictionItem(BaseModel):
+    status: str
+    message: Optional[str] = None
+    Congestion_Level: Optional[str] = None
+    confidence_score: Optional[float] = None
+
+class BatchPredictionResponse(BaseModel):
+    predictions: List[BatchPredictionItem]
+    timestamp: str
+
 class HealthResponse(BaseModel):
     status: str
     model_loaded: bool
     timestamp: str
 
-# Mount static files and templates
-app.mount("/static", StaticFiles(directory="static"), name="static")
-templates = Jinja2Templates(directory="templates")
+# In production a reverse proxy serves /static (see nginx.conf); set
+# SERVE_STATIC=0 there so Python workers only handle API traffic
+if os.getenv("SERVE_STATIC", "1") != "0":
+    app.mount("/static", StaticFiles(directory="static"), name="static")
+
+# Templates are compiled once and never re-checked on disk
+templates = Jinja2Templates(env=Environment(
+    loader=FileSystemLoader("templates"),
+    autoescape=select_autoescape(),
+    auto_reload=False
+))
+templates.env.get_template("index.html")
 
 @app.get("/", response_class=HTMLResponse)
 async def root(request: Request):
     """Serve the main HTML page"""
-    return templates.TemplateResponse("index.html", {"request": request})
+    return templates.TemplateResponse(request, "index.html")
 
-@app.get("/health", response_model=HealthResponse)
+@app.get("/health", responses={200: {"model": HealthResponse}})
 async def health_check():
     """Health check endpoint"""
-    return HealthResponse(
-        status="healthy",
-        model_loaded=model is not None,
-        timestamp=datetime.now().isoformat()
-    )
+    return {
+        "status": "healthy",
+        "model_loaded": model is not None,
+        "timestamp": _now_iso[0]
+    }
 
-@app.post("/predict", response_model=PredictionResponse)
-async def predict_traffic(input_data: TrafficInput):
+@app.post(
+    "/predict",
+    responses={200: {"model": PredictionResponse}},
+    openapi_extra={
+        "requestBody": {
+            "content": {"application/json": {"schema": TrafficInput.model_json_schema()}},
+            "required": True
+        }
+    }
+)
+async def predict_traffic(request: Request):
     """
     Predict traffic congestion level based on input parameters.
+
+    The body is decoded and validated by msgspec rather than Pydantic;
+    the model call itself runs in the threadpool so it never blocks
+    the event loop.
     
     Args:
-        input_data: TrafficInput object containing prediction features
+        request: Request whose JSON body matches TrafficInput
         
     Returns:
-        PredictionResponse with congestion level and confidence score
+        Dict shaped like PredictionResponse with congestion level and confidence score
     """
     try:
-        # Convert input to dictionary
-        input_dict = input_data.dict()
-
-        # Define categorical columns
-        categorical_cols = ['Day_of_Week', 'Public_Holiday', 'Road_Name', 'Population_Density', 'Rainfall']
-        
-        # Create DataFrame with correct column order
-        # Let's first check what columns the model expects
+        body = await request.body()
         try:
-            # Get the expected feature names from the model
-            expected_features = model.feature_names_in_
-            
-            # Create user input DataFrame in the correct order
-            user_input = pd.DataFrame({
-                'Day_of_Week': [input_dict['Day_of_Week']],
-                'Public_Holiday': [input_dict['Public_Holiday']],
-                'Road_Name': [input_dict['Road_Name']],
-                'Population_Density': [input_dict['Population_Density']],
-                'Rainfall': [input_dict['Rainfall']],
-                'Hour': [input_dict['Hour']]
-            })
-            
-        except AttributeError:
-            # If model doesn't have feature_names_in_, use default order
-            user_input = pd.DataFrame({
-                'Hour': [input_dict['Hour']],
-                'Day_of_Week': [input_dict['Day_of_Week']],
-                'Public_Holiday': [input_dict['Public_Holiday']],
-                'Road_Name': [input_dict['Road_Name']],
-                'Population_Density': [input_dict['Population_Density']],
-                'Rainfall': [input_dict['Rainfall']]
-            })
-
-        # Encode categorical variables
-        categorical_cols = ['Day_of_Week', 'Public_Holiday', 'Road_Name', 'Population_Density', 'Rainfall']
-        for col in categorical_cols:
-            user_input[col] = user_input[col].astype(str)
-            if not all(user_input[col].isin(le_dict[col].classes_)):
-                raise HTTPException(
-                    status_code=400,
-                    detail=f"Invalid value in {col}. Must be one of {list(le_dict[col].classes_)}"
-                )
-            user_input[col] = le_dict[col].transform(user_input[col])
-
-        # Predict
-        prediction = model.predict(user_input)
-        predicted_congestion = le_dict['Congestion_Level'].inverse_transform(prediction)[0]
-        
-        # Get prediction probabilities if available
+            input_data = predict_decoder.decode(body)
+        except msgspec.DecodeError as e:
+            raise HTTPException(status_code=422, detail=decode_error_detail(e))
+
+        # Encode features in the model's column order
         try:
-            probabilities = model.predict_proba(user_input)
-            confidence_score = float(max(probabilities[0]))
-        except:
-            confidence_score = 0.8  # Default confidence if predict_proba not available
+            key = encode_input(input_data)
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
 
-        logger.info(f"Prediction made: {predicted_congestion} with confidence {confidence_score}")
+        # Predict, reusing earlier results for identical inputs; only misses
+        # pay for the threadpool hop
+        result = prediction_cache.get(key)
+        if result is None:
+            cache_stats["misses"] += 1
+            result = prediction_cache[key] = await run_in_threadpool(predict_one, key)
+        else:
+            cache_stats["hits"] += 1
+        predicted_congestion, confidence_score = result
 
-        return PredictionResponse(
-            Congestion_Level=predicted_congestion,
-            confidence_score=confidence_score,
-            timestamp=datetime.now().isoformat()
-        )
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Prediction made: {predicted_congestion} with confidence {confidence_score}")
+
+        return {
+            "Congestion_Level": predicted_congestion,
+            "confidence_score": confidence_score,
+            "timestamp": _now_iso[0]
+        }
 
     except HTTPException:
         raise
@@ -162,27 +450,91 @@ async def predict_traffic(input_data: TrafficInput):
         logger.error(f"Prediction error: {e}")
         raise HTTPException(status_code=500, detail=f"Prediction failed: {str(e)}")
 
-@app.get("/model-info")
-async def get_model_info():
-    """Get information about the loaded model and available categories"""
+def batch_error(message: str) -> Dict[str, Any]:
+    """Batch result entry for an item that could not be predicted"""
+    return {
+        "status": "error",
+        "message": message,
+        "Congestion_Level": None,
+        "confidence_score": None
+    }
+
+@app.post("/predict/batch", responses={200: {"model": BatchPredictionResponse}})
+def predict_traffic_batch(batch: BatchInput):
+    """
+    Predict congestion levels for many inputs with a single model call.
+
+    Invalid items do not fail the request; they are reported per item
+    with status "error" and a message.
+    
+    Args:
+        batch: BatchInput containing up to 512 items shaped like TrafficInput
+        
+    Returns:
+        Dict shaped like BatchPredictionResponse with one entry per input item, in order
+    """
     try:
-        model_info = {
-            "model_type": type(model).__name__,
-            "available_categories": {},
-            "expected_features": None
+        items = batch.items
+        results: List[Optional[Dict[str, Any]]] = [None] * len(items)
+
+        # Validate each item on its own so schema errors are reported per row
+        inputs = []
+        input_idx = []
+        for idx, item in enumerate(items):
+            try:
+                inputs.append(msgspec.convert(item, TrafficInputStruct, strict=False))
+            except msgspec.ValidationError as e:
+                results[idx] = batch_error(str(e))
+                continue
+            input_idx.append(idx)
+
+        # Encode all valid items at once; unknown categories are reported and left out of the model call
+        X = get_feature_buffer(len(inputs))
+        errors = encode_batch(inputs, X) if inputs else []
+        valid_rows = []
+        valid_idx = []
+        for row, (idx, error) in enumerate(zip(input_idx, errors)):
+            if error is None:
+                valid_rows.append(row)
+                valid_idx.append(idx)
+            else:
+                results[idx] = batch_error(error)
+
+        if valid_idx:
+            if len(valid_rows) < len(inputs):
+                X = X[valid_rows]
+            predictions, confidence_scores = run_model(X)
+            confidence_scores = confidence_scores.tolist()
+
+            for idx, prediction, confidence_score in zip(valid_idx, predictions, confidence_scores):
+                results[idx] = {
+                    "status": "ok",
+                    "message": None,
+                    "Congestion_Level": CONGESTION_CLASSES[int(prediction)],
+                    "confidence_score": confidence_score
+                }
+
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Batch prediction made: {len(valid_idx)}/{len(items)} items succeeded")
+
+        return {
+            "predictions": results,
+            "timestamp": _now_iso[0]
         }
-        
-        # Get expected feature names if available
-        if hasattr(model, 'feature_names_in_'):
-            model_info["expected_features"] = list(model.feature_names_in_)
-        
-        for col, le in le_dict.items():
-            if hasattr(le, 'classes_'):
-                model_info["available_categories"][col] = list(le.classes_)
-        
-        return model_info
+
     except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Error getting model info: {str(e)}")
+        logger.error(f"Batch prediction error: {e}")
+        raise HTTPException(status_code=500, detail=f"Batch prediction failed: {str(e)}")
+
+@app.get("/model-info")
+async def get_model_info():
+    """Get information about the loaded model and available categories"""
+    return Response(MODEL_INFO_BYTES, media_type="application/json")
+
+@app.get("/cache/stats")
+async def get_cache_stats():
+    """Get hit/miss statistics for the prediction cache"""
+    return {**cache_stats, "maxsize": CACHE_MAXSIZE, "currsize": len(prediction_cache)}
 
 @app.get("/api-docs")
 async def api_documentation():
@@ -191,4 +543,12 @@ async def api_documentation():
 
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8000, reload=True) 
\ No newline at end of file
+    uvicorn.run(
+        "app:app",
+        host=os.getenv("HOST", "0.0.0.0"),
+        port=int(os.getenv("PORT", 8000)),
+        workers=os.cpu_count(),
+        loop="uvloop",
+        http="httptools",
+        reload=False
+    ) 
\ No newline at end of file
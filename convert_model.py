@@ -0,0 +1,38 @@
+#!/usr/bin/env python3
+"""
+Convert the trained scikit-learn model to ONNX for faster inference with ONNX Runtime
+"""
+
+import hashlib
+import joblib
+from skl2onnx import convert_sklearn
+from skl2onnx.common.data_types import FloatTensorType
+
+MODEL_PATH = "model/traffic_model.pkl"
+ONNX_MODEL_PATH = "model/traffic_model.onnx"
+
+def main():
+    """Convert MODEL_PATH and write it to ONNX_MODEL_PATH"""
+    model = joblib.load(MODEL_PATH)
+
+    onnx_model = convert_sklearn(
+        model,
+        initial_types=[("input", FloatTensorType([None, model.n_features_in_]))],
+        # Return probabilities as a plain tensor instead of a list of dicts
+        options={id(model): {"zipmap": False}},
+        target_opset=17
+    )
+
+    # Record which pickle this graph came from so the API can detect a stale ONNX file
+    with open(MODEL_PATH, "rb") as f:
+        model_hash = onnx_model.metadata_props.add()
+        model_hash.key = "source_model_sha256"
+        model_hash.value = hashlib.sha256(f.read()).hexdigest()
+
+    with open(ONNX_MODEL_PATH, "wb") as f:
+        f.write(onnx_model.SerializeToString())
+
+    print(f"✅ Wrote {ONNX_MODEL_PATH}")
+
+if __name__ == "__main__":
+    main()
@@ -70,6 +70,72 @@ def test_prediction(input_data: Dict[str, Any]):
         print(f"❌ Prediction error: {e}")
         return False
 
+def test_batch_prediction():
+    """Test the batch prediction endpoint with one valid and one invalid item"""
+    print("\n📦 Testing batch prediction...")
+    batch_data = {
+        "items": [
+            {
+                "Hour": 8,
+                "Day_of_Week": "Monday",
+                "Public_Holiday": "No",
+                "Road_Name": "KN 1 Rd",
+                "Population_Density": "High",
+                "Rainfall": "No"
+            },
+            {
+                "Hour": 25,  # Invalid hour
+                "Day_of_Week": "Monday",
+                "Public_Holiday": "No",
+                "Road_Name": "KN 1 Rd",
+                "Population_Density": "High",
+                "Rainfall": "No"
+            }
+        ]
+    }
+    try:
+        response = requests.post(
+            f"{BASE_URL}/predict/batch",
+            json=batch_data,
+            headers={"Content-Type": "application/json"}
+        )
+
+        if response.status_code == 200:
+            predictions = response.json()["predictions"]
+            statuses = [p["status"] for p in predictions]
+            if statuses == ["ok", "error"]:
+                print(f"✅ Batch prediction successful:")
+                print(f"   Congestion Level: {predictions[0]['Congestion_Level']}")
+                print(f"   Invalid item: {predictions[1]['message']}")
+                return True
+            print(f"❌ Unexpected batch statuses: {statuses}")
+            return False
+        else:
+            print(f"❌ Batch prediction failed: {response.status_code}")
+            print(f"   Error: {response.text}")
+            return False
+    except Exception as e:
+        print(f"❌ Batch prediction error: {e}")
+        return False
+
+def test_cache_stats():
+    """Test the prediction cache statistics endpoint"""
+    print("\n🗄️  Testing cache stats...")
+    try:
+        response = requests.get(f"{BASE_URL}/cache/stats")
+        if response.status_code == 200:
+            data = response.json()
+            print(f"✅ Cache stats retrieved:")
+            print(f"   Hits: {data['hits']}, Misses: {data['misses']}")
+            print(f"   Size: {data['currsize']}/{data['maxsize']}")
+            return True
+        else:
+            print(f"❌ Cache stats failed: {response.status_code}")
+            return False
+    except Exception as e:
+        print(f"❌ Cache stats error: {e}")
+        return False
+
 def test_invalid_input():
     """Test with invalid input data"""
     print("\n⚠️  Testing invalid input...")
@@ -134,7 +200,9 @@ def main():
             "Road_Name": "RN1",
             "Population_Density": "Medium",
             "Rainfall": "Yes"
-        }))
+        })),
+        ("Batch Prediction", test_batch_prediction),
+        ("Cache Stats", test_cache_stats)
     ]
     
     passed = 0